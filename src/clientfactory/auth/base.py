@@ -6,7 +6,7 @@ Defines base classes and interfaces for authentication providers
 """
 from __future__ import annotations
 import typing as t
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime
 
 from clientfactory.core import Request
@@ -24,13 +24,17 @@ class AuthState:
     token: t.Optional[str] = None
     expires: t.Optional[datetime] = None
     metadata: dict[str, t.Any] = field(default_factory=dict)
+    clock: InitVar[t.Callable[[], datetime]] = datetime.now
+
+    def __post_init__(self, clock: t.Callable[[], datetime]) -> None:
+        self._clock = clock
 
     @property
     def expired(self) -> bool:
         """Check if the authentication has expired"""
         if self.expires is None:
             return False
-        return (datetime.now() > self.expires)
+        return (self._clock() > self.expires)
 
 class BaseAuth(DeclarativeComponent):
     """
@@ -44,10 +48,11 @@ class BaseAuth(DeclarativeComponent):
     """
 
     __declarativetype__ = 'auth'
+    _now: t.Callable[[], datetime] = staticmethod(datetime.now)  # clock used for expiration, overridable in tests
 
     def __init__(self, **kwargs):
         """Initialize auth provider with default state"""
-        self.state = AuthState()
+        self.state = self._newstate()
 
         # initialize from metadata
         for k, v in self.getallmetadata().items():
@@ -58,19 +63,6 @@ class BaseAuth(DeclarativeComponent):
             if hasattr(self, k):
                 setattr(self, k, v)
 
-    @classmethod
-    def _processclassattributes(cls) -> None:
-        """Process auth-specific class attributes into metadata"""
-        super()._processclassattributes()
-        for name, value in vars(cls).items():
-            if (
-                not name.startswith('_')
-                and not callable(value)
-                and not isinstance(value, type)
-                and not isinstance(value, property)
-            ):
-                cls.__metadata__[name] = value
-
     def _authenticate(self) -> bool:
         """
         Perform provider-specific authentication.
@@ -123,9 +115,13 @@ class BaseAuth(DeclarativeComponent):
         """
         return self.authenticate()
 
+    def _newstate(self) -> AuthState:
+        """Create an empty state that checks expiry against this provider's clock"""
+        return AuthState(clock=self._now)
+
     def clear(self) -> None:
         """Reset the authentication state"""
-        self.state = AuthState()
+        self.state = self._newstate()
 
     @property
     def isauthenticated(self) -> bool:
@@ -188,15 +188,8 @@ class OAuthAuth(BaseAuth):
         return super().refresh()
 
 
-    def authorizeurl(self, state: t.Optional[str] = None) -> str:
-        """Get the authorization URL for the authorization code flow."""
-        if not self.config.authurl:
-            raise OAuthError(f"Authorization URL not configured")
-
-        if not self.config.redirecturi:
-            raise OAuthError(f"Redirect URI not configured")
-
-        from urllib.parse import urlencode
+    def _authorizeparams(self, state: t.Optional[str] = None) -> dict:
+        """Build the query parameters for the authorization URL."""
         params = {
             "response_type": "code",
             "client_id": self.config.clientid,
@@ -206,7 +199,18 @@ class OAuthAuth(BaseAuth):
             params["scope"] = self.config.scope
         if state:
             params["state"] = state
-        return f"{self.config.authurl}?{urlencode(params)}"
+        return params
+
+    def authorizeurl(self, state: t.Optional[str] = None) -> str:
+        """Get the authorization URL for the authorization code flow."""
+        if not self.config.authurl:
+            raise OAuthError(f"Authorization URL not configured")
+
+        if not self.config.redirecturi:
+            raise OAuthError(f"Redirect URI not configured")
+
+        from urllib.parse import urlencode
+        return f"{self.config.authurl}?{urlencode(self._authorizeparams(state))}"
 
 
     def exchangecode(self, code: str) -> bool:
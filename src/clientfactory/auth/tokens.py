@@ -6,7 +6,7 @@ Implements token-based authentication (including Bearer tokens).
 """
 from __future__ import annotations
 import enum, typing as t
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from clientfactory.core import Request
 from clientfactory.auth.base import BaseAuth, AuthError, AuthState
@@ -59,7 +59,7 @@ class TokenAuth(BaseAuth):
         self.state.authenticated = bool(self.token)
 
         if self.expiresin is not None:
-            self.state.expires = (datetime.now() + timedelta(seconds=self.expiresin))
+            self.state.expires = (self._now() + timedelta(seconds=self.expiresin))
 
 
     def _setscheme(self, scheme:  (str | TokenScheme)) -> TokenScheme:
@@ -105,7 +105,7 @@ class TokenAuth(BaseAuth):
         self.state.authenticated = True
 
         if expiresin is not None:
-            self.state.expires = (datetime.now() + timedelta(seconds=expiresin))
+            self.state.expires = (self._now() + timedelta(seconds=expiresin))
         else:
             self.state.expires = None
 
@@ -25,12 +25,8 @@ def validateinput(validator: t.Callable[[dict], dict]):
         @fn.wraps(method)
         def wrapper(*args, **kwargs):
             # The first argument could be 'self' if it's a method in a class
-            # We don't need to pass it to the validator
-            try:
-                validated = validator(kwargs)
-                kwargs.update(validated)
-            except ValidationError as e:
-                raise
+            # We don't need to pass it to the validator; ValidationError propagates
+            kwargs.update(validator(kwargs))
 
             # Pass all arguments to the original method
             return method(*args, **kwargs)
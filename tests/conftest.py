@@ -11,6 +11,21 @@ from clientfactory.core.response import Response
 from clientfactory.core.session import Session
 from clientfactory.declarative.base import DeclarativeComponent
 
+# warm sys.modules once so test-module imports during collection are cache hits
+import clientfactory.client  # noqa
+import clientfactory.core.payload  # noqa
+import clientfactory.core.resource  # noqa
+
+def pytest_collection_modifyitems(items):
+    """Mark unit tests by location so they can be selected with `-m`"""
+    for item in items:
+        if item.nodeid.startswith("tests/unit/"):
+            item.add_marker(pytest.mark.unit)
+            if item.nodeid.startswith("tests/unit/client/"):
+                item.add_marker(pytest.mark.client)
+            elif item.nodeid.startswith("tests/unit/core/"):
+                item.add_marker(pytest.mark.core)
+
 @pytest.fixture(autouse=True)
 def setup_logging():
     """Configure logging for all tests"""
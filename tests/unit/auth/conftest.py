@@ -0,0 +1,7 @@
+# ~/ClientFactory/tests/unit/auth/conftest.py
+"""
+Pytest configuration for auth unit tests.
+"""
+# resolve `clientfactory.auth.oauth.rq` once up front so the
+# `patch('clientfactory.auth.oauth.rq.post')` targets hit sys.modules
+import clientfactory.auth.oauth  # noqa
@@ -4,18 +4,63 @@ import pytest
 from datetime import datetime, timedelta
 
 from clientfactory.auth import (
-    BaseAuth, BasicAuth, APIKeyAuth, TokenAuth, OAuthAuth,
+    AuthError, BaseAuth, BasicAuth, APIKeyAuth, TokenAuth, OAuthAuth,
     TokenScheme, KeyLocation, OAuthConfig, OAuthFlow
 )
 from clientfactory.decorators.auth import authprovider, auth
 
+# decorated classes are built once at import rather than per test
+
+@authprovider
+class CustomAuth(BaseAuth):
+    name = "custom"
+    value = "test"
+
+@auth.basic
+class MyBasic:
+    username = "testuser"
+    password = "testpass"
+
+@auth.apikey
+class MyAPIKey:
+    key = "test-key"
+    name = "X-Test-Key"
+    location = KeyLocation.HEADER
+    prefix = "Test"
+
+@auth.token
+class MyToken:
+    token = "test-token"
+    scheme = TokenScheme.BEARER
+    expiresin = 3600
+
+@auth.oauth
+class MyOAuth:
+    clientid = "test-client"
+    clientsecret = "test-secret"
+    tokenurl = "https://test.com/token"
+    authurl = "https://test.com/auth"
+    scope = "read write"
+    flow = OAuthFlow.CLIENTCREDENTIALS
+
+@authprovider
+class BaseCustomAuth(BaseAuth):
+    shared = "base"
+    overridden = "base"
+
+@authprovider
+class ChildCustomAuth(BaseCustomAuth):
+    overridden = "child"
+    new = "child"
+
+@auth.apikey
+class ConfigurableAuth:
+    key = "default"
+    name = "X-API-Key"
+    location = KeyLocation.HEADER
+
 def test_base_declarative_attributes():
     """Test basic declarative attribute processing"""
-    @authprovider
-    class CustomAuth(BaseAuth):
-        name = "custom"
-        value = "test"
-
     assert CustomAuth.getmetadata('name') == "custom"
     assert CustomAuth.getmetadata('value') == "test"
 
@@ -25,11 +70,6 @@ def test_base_declarative_attributes():
 
 def test_basic_auth_declarative():
     """Test BasicAuth declarative functionality"""
-    @auth.basic
-    class MyBasic:
-        username = "testuser"
-        password = "testpass"
-
     auth_instance = MyBasic()
     assert auth_instance.username == "testuser"
     assert auth_instance.password == "testpass"
@@ -41,13 +81,6 @@ def test_basic_auth_declarative():
 
 def test_apikey_auth_declarative():
     """Test APIKeyAuth declarative functionality"""
-    @auth.apikey
-    class MyAPIKey:
-        key = "test-key"
-        name = "X-Test-Key"
-        location = KeyLocation.HEADER
-        prefix = "Test"
-
     auth_instance = MyAPIKey()
     assert auth_instance.key == "test-key"
     assert auth_instance.name == "X-Test-Key"
@@ -62,12 +95,6 @@ def test_apikey_auth_declarative():
 
 def test_token_auth_declarative():
     """Test TokenAuth declarative functionality"""
-    @auth.token
-    class MyToken:
-        token = "test-token"
-        scheme = TokenScheme.BEARER
-        expiresin = 3600
-
     auth_instance = MyToken()
     assert auth_instance.token == "test-token"
     assert auth_instance.scheme == TokenScheme.BEARER
@@ -79,15 +106,6 @@ def test_token_auth_declarative():
 
 def test_oauth_auth_declarative():
     """Test OAuthAuth declarative functionality"""
-    @auth.oauth
-    class MyOAuth:
-        clientid = "test-client"
-        clientsecret = "test-secret"
-        tokenurl = "https://test.com/token"
-        authurl = "https://test.com/auth"
-        scope = "read write"
-        flow = OAuthFlow.CLIENTCREDENTIALS
-
     auth_instance = MyOAuth()
     assert isinstance(auth_instance.config, OAuthConfig)
     assert auth_instance.config.clientid == "test-client"
@@ -99,15 +117,9 @@ def test_oauth_auth_declarative():
 
 def test_auth_inheritance():
     """Test that declarative attributes are properly inherited"""
-    @authprovider
-    class BaseCustomAuth(BaseAuth):
-        shared = "base"
-        overridden = "base"
-
-    @authprovider
-    class ChildCustomAuth(BaseCustomAuth):
-        overridden = "child"
-        new = "child"
+    # inherited metadata is resolved onto the child class at definition time
+    assert ChildCustomAuth.__metadata__['shared'] == "base"
+    assert ChildCustomAuth.getmetadata('overridden') == "child"
 
     instance = ChildCustomAuth()
     assert instance.shared == "base"
@@ -116,20 +128,13 @@ def test_auth_inheritance():
 
 def test_invalid_auth_type():
     """Test that invalid auth types are caught"""
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(AuthError, match="Invalid authtype"):
         @authprovider(authtype=str)  # str is not a valid auth type
         class InvalidAuth:
             pass
-    assert "Invalid authtype" in str(exc.value)
 
 def test_constructor_override():
     """Test that constructor arguments properly override declarative attributes"""
-    @auth.apikey
-    class ConfigurableAuth:
-        key = "default"
-        name = "X-API-Key"
-        location = KeyLocation.HEADER
-
     # Test defaults
     default_instance = ConfigurableAuth()
     assert default_instance.key == "default"
@@ -146,6 +151,7 @@ def test_constructor_override():
 
 def test_metadata_access():
     """Test that metadata can be accessed and modified"""
+    # mutates its metadata, so it gets its own class
     @authprovider
     class MetadataAuth(BaseAuth):
         test_value = "original"
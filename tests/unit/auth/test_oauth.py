@@ -6,7 +6,7 @@ import pytest
 import json
 import time
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 from clientfactory.auth.oauth import OAuthAuth, OAuthConfig, OAuthToken, OAuthFlow, OAuthError
 from clientfactory.auth.tokens import TokenScheme
@@ -38,6 +38,30 @@ def oauth_config():
     )
 
 
+# expected token endpoint payloads for the `oauth_config` fixture
+_CC_DATA = {
+    "grant_type": "client_credentials",
+    "client_id": "test-client",
+    "client_secret": "test-secret",
+    "scope": "read write"
+}
+
+_REFRESH_DATA = {
+    "grant_type": "refresh_token",
+    "refresh_token": "test-refresh",
+    "client_id": "test-client",
+    "client_secret": "test-secret"
+}
+
+_CODE_DATA = {
+    "grant_type": "authorization_code",
+    "code": "test-code",
+    "client_id": "test-client",
+    "client_secret": "test-secret",
+    "redirect_uri": "https://client.example.com/callback"
+}
+
+
 def test_init(oauth_config):
     """Test initialization"""
     # Basic initialization
@@ -64,9 +88,7 @@ def test_authenticate_client_credentials(oauth_config, mock_token_response):
     """Test authentication with client credentials flow"""
     with patch('clientfactory.auth.oauth.rq.post') as mock_post:
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_token_response
-        mock_post.return_value = mock_response
+        mock_post.return_value = Mock(**{"json.return_value": mock_token_response})
 
         # Test authentication
         auth = OAuthAuth(oauth_config)
@@ -75,12 +97,7 @@ def test_authenticate_client_credentials(oauth_config, mock_token_response):
         # Check that post was called with correct parameters
         mock_post.assert_called_once_with(
             oauth_config.tokenurl,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": oauth_config.clientid,
-                "client_secret": oauth_config.clientsecret,
-                "scope": oauth_config.scope
-            },
+            data=_CC_DATA,
             headers={}
         )
 
@@ -141,9 +158,7 @@ def test_prepare_without_token(oauth_config, mock_token_response):
     """Test preparing a request without a token triggers authentication"""
     with patch('clientfactory.auth.oauth.rq.post') as mock_post:
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_token_response
-        mock_post.return_value = mock_response
+        mock_post.return_value = Mock(**{"json.return_value": mock_token_response})
 
         # Create auth without token
         auth = OAuthAuth(oauth_config)
@@ -174,11 +189,7 @@ def test_refresh_token(oauth_config, mock_token_response):
 
     with patch('clientfactory.auth.oauth.rq.post') as mock_post:
         # Setup mock response with new token
-        mock_response = MagicMock()
-        new_token_data = mock_token_response.copy()
-        new_token_data["access_token"] = "new-token"
-        mock_response.json.return_value = new_token_data
-        mock_post.return_value = mock_response
+        mock_post.return_value = Mock(**{"json.return_value": {**mock_token_response, "access_token": "new-token"}})
 
         # Create auth with token
         auth = OAuthAuth(oauth_config, token)
@@ -189,12 +200,7 @@ def test_refresh_token(oauth_config, mock_token_response):
         # Check that post was called with correct parameters
         mock_post.assert_called_once_with(
             oauth_config.tokenurl,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": "test-refresh",
-                "client_id": oauth_config.clientid,
-                "client_secret": oauth_config.clientsecret
-            },
+            data=_REFRESH_DATA,
             headers={}
         )
 
@@ -239,9 +245,7 @@ def test_refresh_without_refresh_token(oauth_config, mock_token_response):
 
     with patch('clientfactory.auth.oauth.rq.post') as mock_post:
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_token_response
-        mock_post.return_value = mock_response
+        mock_post.return_value = Mock(**{"json.return_value": mock_token_response})
 
         # Create auth with token
         auth = OAuthAuth(oauth_config, token)
@@ -257,24 +261,17 @@ def test_refresh_without_refresh_token(oauth_config, mock_token_response):
 
 def test_authorize_url(oauth_config):
     """Test generating authorization URL"""
-    import urllib.parse
-
     auth = OAuthAuth(oauth_config)
     url = auth.authorizeurl(state="test-state")
 
-    # Parse the URL to get the query parameters
-    parsed_url = urllib.parse.urlparse(url)
-    query_params = urllib.parse.parse_qs(parsed_url.query)
-
-    # Check that base URL is correct
-    assert parsed_url.scheme + "://" + parsed_url.netloc + parsed_url.path == oauth_config.authurl
-
-    # Check that the expected query parameters are present with correct values
-    assert query_params.get('client_id') == [oauth_config.clientid]
-    assert query_params.get('redirect_uri') == [oauth_config.redirecturi]
-    assert query_params.get('scope') == [oauth_config.scope]
-    assert query_params.get('response_type') == ['code']
-    assert query_params.get('state') == ['test-state']
+    assert url == (
+        "https://auth.example.com/authorize"
+        "?response_type=code"
+        "&client_id=test-client"
+        "&redirect_uri=https%3A%2F%2Fclient.example.com%2Fcallback"
+        "&scope=read+write"
+        "&state=test-state"
+    )
 
 
 def test_authorize_url_missing_config():
@@ -306,9 +303,7 @@ def test_exchange_code(oauth_config, mock_token_response):
     """Test exchanging authorization code for tokens"""
     with patch('clientfactory.auth.oauth.rq.post') as mock_post:
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_token_response
-        mock_post.return_value = mock_response
+        mock_post.return_value = Mock(**{"json.return_value": mock_token_response})
 
         # Create auth
         auth = OAuthAuth(oauth_config)
@@ -319,13 +314,7 @@ def test_exchange_code(oauth_config, mock_token_response):
         # Check that post was called with correct parameters
         mock_post.assert_called_once_with(
             oauth_config.tokenurl,
-            data={
-                "grant_type": "authorization_code",
-                "code": "test-code",
-                "client_id": oauth_config.clientid,
-                "client_secret": oauth_config.clientsecret,
-                "redirect_uri": oauth_config.redirecturi
-            },
+            data=_CODE_DATA,
             headers={}
         )
 
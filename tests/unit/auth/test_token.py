@@ -4,7 +4,7 @@ Unit tests for the TokenAuth class
 """
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from clientfactory.auth.tokens import TokenAuth, TokenScheme, TokenError
 from clientfactory.core import Request, RequestMethod
@@ -104,34 +104,50 @@ def test_update_token():
     assert prepared.headers["Authorization"] == "Bearer new-token"
 
 
-def test_update_token_with_expiration():
+@pytest.fixture
+def clock(monkeypatch):
+    """Pin the clock used for expiration; set clock[0] to move it"""
+    now = [datetime(2020, 1, 1, 12, 0, 0)]
+    monkeypatch.setattr(TokenAuth, "_now", staticmethod(lambda: now[0]))
+    return now
+
+
+def test_update_token_with_expiration(clock):
     """Test updating the token with an expiration time"""
     auth = TokenAuth("test-token")
 
     # Update token with expiration
-    with patch('clientfactory.auth.tokens.datetime') as mock_datetime:
-        mock_now = datetime(2020, 1, 1, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+    auth.updatetoken("new-token", 3600)  # 1 hour
 
-        auth.updatetoken("new-token", 3600)  # 1 hour
+    # Check that expiration was set
+    expected_expiry = clock[0] + timedelta(seconds=3600)
+    assert auth.state.expires == expected_expiry
 
-        # Check that expiration was set
-        expected_expiry = mock_now + timedelta(seconds=3600)
-        assert auth.state.expires == expected_expiry
+    # Expiry is checked against the same clock
+    assert not auth.state.expired
+    clock[0] = expected_expiry + timedelta(seconds=1)
+    assert auth.state.expired
 
 
-def test_class_methods():
+def test_clear_keeps_clock(clock):
+    """Test that a cleared state still checks expiry against the provider clock"""
+    auth = TokenAuth("test-token")
+    auth.clear()
+    auth.updatetoken("new-token", 3600)
+
+    assert not auth.state.expired
+    clock[0] = auth.state.expires + timedelta(seconds=1)
+    assert auth.state.expired
+
+
+@pytest.mark.parametrize("factory,scheme", [
+    (TokenAuth.Bearer, TokenScheme.BEARER),
+    (TokenAuth.JWT, TokenScheme.JWT),
+    (TokenAuth.Token, TokenScheme.TOKEN),
+    (TokenAuth.MAC, TokenScheme.MAC),
+    (TokenAuth.Hawk, TokenScheme.HAWK),
+    (TokenAuth.Custom, TokenScheme.CUSTOM),
+])
+def test_class_methods(factory, scheme):
     """Test the class methods for creating different token types"""
-    # Test Bearer token
-    auth = TokenAuth.Bearer("test-token")
-    assert auth.scheme == TokenScheme.BEARER
-
-    # Test JWT token
-    auth = TokenAuth.JWT("test-token")
-    assert auth.scheme == TokenScheme.JWT
-
-    # Test other token types
-    assert TokenAuth.Token("test-token").scheme == TokenScheme.TOKEN
-    assert TokenAuth.MAC("test-token").scheme == TokenScheme.MAC
-    assert TokenAuth.Hawk("test-token").scheme == TokenScheme.HAWK
-    assert TokenAuth.Custom("test-token").scheme == TokenScheme.CUSTOM
+    assert factory("test-token").scheme is scheme
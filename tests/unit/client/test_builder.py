@@ -1,47 +1,58 @@
 # ~/ClientFactory/tests/unit/client/test_builder.py
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
 from clientfactory.client import ClientBuilder, Client, ClientConfig
 
 
+@pytest.fixture
+def builder():
+    """Return a fresh builder"""
+    return ClientBuilder()
+
+
+@pytest.fixture
+def mock_client_cls(mocker):
+    """Patch the Client class used by the builder"""
+    cls = mocker.patch('clientfactory.client.builder.Client')
+    cls.return_value = Mock(spec=Client)
+    return cls
+
+
 class TestClientBuilder:
     """Tests for the ClientBuilder class"""
 
-    def test_init(self):
+    def test_init(self, builder):
         """Test initializing a builder"""
-        builder = ClientBuilder()
         assert isinstance(builder._config, ClientConfig)
         assert builder._auth is None
         assert builder._resources == []
+        assert builder._config.verifyssl is True
+        assert builder._config.followredirects is True
 
-    def test_baseurl(self):
-        """Test setting the base URL"""
-        builder = ClientBuilder()
-        url = "https://api.example.com"
-        result = builder.baseurl(url)
+    @pytest.mark.parametrize("method,value,configattr", [
+        ("baseurl", "https://api.example.com", "baseurl"),
+        ("headers", {"User-Agent": "Test", "X-Api-Key": "123"}, "headers"),
+        ("cookies", {"session": "abc123"}, "cookies"),
+        ("verifyssl", False, "verifyssl"),
+        ("timeout", 60.0, "timeout"),
+        ("followredirects", False, "followredirects"),
+    ])
+    def test_config_setters(self, builder, method, value, configattr):
+        """Test config setters update the config and return the builder"""
+        result = getattr(builder, method)(value)
         assert result is builder  # Test method chaining returns self
-        assert builder._config.baseurl == url
+        assert getattr(builder._config, configattr) == value
 
-    def test_auth(self):
+    def test_auth(self, builder):
         """Test setting the authentication handler"""
-        builder = ClientBuilder()
-        auth = MagicMock()
+        auth = Mock()
         result = builder.auth(auth)
         assert result is builder
         assert builder._auth is auth
 
-    def test_headers(self):
-        """Test setting headers"""
-        builder = ClientBuilder()
-        headers = {"User-Agent": "Test", "X-Api-Key": "123"}
-        result = builder.headers(headers)
-        assert result is builder
-        assert builder._config.headers == headers
-
-    def test_headers_update(self):
+    def test_headers_update(self, builder):
         """Test that headers are updated, not replaced"""
-        builder = ClientBuilder()
         # Set initial headers
         builder.headers({"User-Agent": "Test"})
         # Update with additional headers
@@ -51,67 +62,27 @@ class TestClientBuilder:
             "X-Api-Key": "123"
         }
 
-    def test_cookies(self):
-        """Test setting cookies"""
-        builder = ClientBuilder()
-        cookies = {"session": "abc123"}
-        result = builder.cookies(cookies)
-        assert result is builder
-        assert builder._config.cookies == cookies
-
-    def test_verifyssl(self):
-        """Test configuring SSL verification"""
-        builder = ClientBuilder()
-        # Default should be True
-        assert builder._config.verifyssl is True
-        # Set to False
-        result = builder.verifyssl(False)
-        assert result is builder
-        assert builder._config.verifyssl is False
-
-    def test_timeout(self):
-        """Test setting request timeout"""
-        builder = ClientBuilder()
-        timeout = 60.0
-        result = builder.timeout(timeout)
-        assert result is builder
-        assert builder._config.timeout == timeout
-
-    def test_followredirects(self):
-        """Test configuring redirect following"""
-        builder = ClientBuilder()
-        # Default should be True
-        assert builder._config.followredirects is True
-        # Set to False
-        result = builder.followredirects(False)
-        assert result is builder
-        assert builder._config.followredirects is False
-
-    def test_register_resource(self):
+    def test_register_resource(self, builder):
         """Test registering a resource class"""
-        builder = ClientBuilder()
-        resource = MagicMock()
+        resource = Mock()
         result = builder.register(resource)
         assert result is builder
         assert builder._resources == [resource]
 
-    @patch('clientfactory.client.builder.Client')
-    def test_build(self, mock_client):
+    def test_build(self, builder, mock_client_cls):
         """Test building a client"""
         # Setup
-        mock_client_instance = MagicMock()
-        mock_client.return_value = mock_client_instance
+        mock_client_instance = mock_client_cls.return_value
 
-        builder = ClientBuilder()
         builder.baseurl("https://api.example.com")
         builder.timeout(60.0)
         builder.verifyssl(False)
 
-        auth = MagicMock()
+        auth = Mock()
         builder.auth(auth)
 
-        resource1 = MagicMock()
-        resource2 = MagicMock()
+        resource1 = Mock()
+        resource2 = Mock()
         builder.register(resource1)
         builder.register(resource2)
 
@@ -122,7 +93,7 @@ class TestClientBuilder:
         assert client is mock_client_instance
 
         # Verify client was created with correct params
-        mock_client.assert_called_once_with(
+        mock_client_cls.assert_called_once_with(
             baseurl=builder._config.baseurl,
             auth=auth,
             config=builder._config
@@ -133,28 +104,26 @@ class TestClientBuilder:
         mock_client_instance.register.assert_any_call(resource1)
         mock_client_instance.register.assert_any_call(resource2)
 
-    def test_method_chaining(self):
+    def test_method_chaining(self, mock_client_cls):
         """Test full method chaining"""
-        with patch('clientfactory.client.builder.Client') as mock_client:
-            mock_client_instance = MagicMock()
-            mock_client.return_value = mock_client_instance
-
-            auth = MagicMock()
-            resource = MagicMock()
-
-            # Chain all methods
-            client = (
-                ClientBuilder()
-                .baseurl("https://api.example.com")
-                .auth(auth)
-                .headers({"User-Agent": "Test"})
-                .cookies({"session": "abc123"})
-                .verifyssl(True)
-                .timeout(60.0)
-                .followredirects(True)
-                .register(resource)
-                .build()
-            )
-
-            assert client is mock_client_instance
-            mock_client_instance.register.assert_called_once_with(resource)
+        mock_client_instance = mock_client_cls.return_value
+
+        auth = Mock()
+        resource = Mock()
+
+        # Chain all methods
+        client = (
+            ClientBuilder()
+            .baseurl("https://api.example.com")
+            .auth(auth)
+            .headers({"User-Agent": "Test"})
+            .cookies({"session": "abc123"})
+            .verifyssl(True)
+            .timeout(60.0)
+            .followredirects(True)
+            .register(resource)
+            .build()
+        )
+
+        assert client is mock_client_instance
+        mock_client_instance.register.assert_called_once_with(resource)
@@ -1,10 +1,18 @@
 # ~/ClientFactory/tests/unit/client/test_client.py
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import clientfactory.client.base as clientbase
 from clientfactory.client import Client, ClientConfig, ClientError
 from clientfactory.core import Resource, ResourceConfig
 
+@pytest.fixture
+def patched_session(monkeypatch):
+    """Replace the Session class used by Client"""
+    fake = MagicMock()
+    monkeypatch.setattr(clientbase, 'Session', fake)
+    return fake
+
 
 class TestClient:
     """Tests for the Client class"""
@@ -48,12 +56,9 @@ class TestClient:
         assert client.baseurl == baseurl
         assert client._config.baseurl == baseurl
 
-    @patch('clientfactory.client.base.Session')
-    def test_create_session(self, mock_session):
+    def test_create_session(self, patched_session):
         """Test session creation"""
         # Setup
-        mock_session_instance = MagicMock()
-        mock_session.return_value = mock_session_instance
         auth = MagicMock()
         config = ClientConfig(
             headers={"User-Agent": "Test"},
@@ -65,8 +70,8 @@ class TestClient:
         client = Client(auth=auth, config=config)
 
         # Assert session was created with correct config
-        mock_session.assert_called_once()
-        call_kwargs = mock_session.call_args.kwargs
+        patched_session.assert_called_once()
+        call_kwargs = patched_session.call_args.kwargs
         assert call_kwargs["auth"] is auth
 
         # Check that config was properly translated to session config
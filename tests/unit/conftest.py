@@ -0,0 +1,9 @@
+# ~/ClientFactory/tests/unit/conftest.py
+"""
+Pytest configuration for unit tests.
+"""
+# core.request/response/session are already imported by tests/conftest.py;
+# warm the packages the session, resources and decorators tests share
+import clientfactory.decorators  # noqa
+import clientfactory.resources  # noqa
+import clientfactory.session  # noqa
@@ -0,0 +1,90 @@
+# ~/ClientFactory/tests/unit/core/conftest.py
+"""
+Pytest configuration for core tests.
+"""
+import pytest
+from unittest.mock import MagicMock, create_autospec
+
+from clientfactory.core.request import RequestMethod
+from clientfactory.core.session import Session, SessionConfig
+from clientfactory.core.resource import ResourceConfig, MethodConfig
+
+
+def _default_response():
+    """Create a simple successful response mock"""
+    response = MagicMock()
+    response.statuscode = 200
+    response.text = '{"success": true}'
+    response.json.return_value = {"success": True}
+    return response
+
+
+# Built in a fixture rather than at import: each xdist worker is its own
+# process and builds its own, and tests within a worker share it via reset.
+@pytest.fixture(scope="session")
+def _session_spec():
+    """Autospec Session once per worker; introspection is the expensive part"""
+    return create_autospec(Session, instance=True)
+
+
+@pytest.fixture
+def mock_session(_session_spec):
+    """Return the shared session mock with its recorded calls cleared"""
+    _session_spec.reset_mock()
+    _session_spec.send.return_value = _default_response()
+    return _session_spec
+
+
+@pytest.fixture(scope="session")
+def default_session_config():
+    """Default session configuration; only pass to sessions built without headers/cookies"""
+    return SessionConfig()
+
+
+@pytest.fixture(scope="session")
+def simple_resource_config():
+    """Create a simple resource configuration"""
+    return ResourceConfig(
+        name="test",
+        path="test",
+        methods={
+            "list": MethodConfig(
+                name="list",
+                method=RequestMethod.GET,
+                path="items"
+            ),
+            "create": MethodConfig(
+                name="create",
+                method=RequestMethod.POST,
+                path="items"
+            ),
+            "get": MethodConfig(
+                name="get",
+                method=RequestMethod.GET,
+                path="items/{id}"
+            )
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def nested_resource_config():
+    """Create a nested resource configuration"""
+    parent = ResourceConfig(
+        name="parent",
+        path="parents"
+    )
+
+    child = ResourceConfig(
+        name="child",
+        path="children",
+        parent=parent
+    )
+
+    grandchild = ResourceConfig(
+        name="grandchild",
+        path="grandchildren",
+        parent=child
+    )
+
+    return grandchild
@@ -1,10 +1,18 @@
 # ~/ClientFactory/tests/unit/core/test_conditional_parameter.py
+import re
 import pytest
 from clientfactory.core.payload import (
     Parameter, ConditionalParameter, ValidationError,
     ParameterType as PT, Payload
 )
 
+# error message patterns, compiled once for reuse across tests
+_INVALID_CONDITION_RE = re.compile("Invalid condition types")
+_MISSING_CTX_RE = re.compile("Context required")
+_MISSING_DEP_RE = re.compile("Missing required dependency")
+_REQUIRED_RE = re.compile("is required")
+_VALIDATION_FAILED_RE = re.compile("Conditional validation failed")
+
 def test_basic_initialization():
     """Test basic ConditionalParameter initialization"""
     param = ConditionalParameter(
@@ -16,7 +24,7 @@ def test_basic_initialization():
 
 def test_invalid_condition_type():
     """Test that invalid condition types raise ValidationError"""
-    with pytest.raises(ValidationError, match="Invalid condition types"):
+    with pytest.raises(ValidationError, match=_INVALID_CONDITION_RE):
         ConditionalParameter(
             dependencies=('a',),
             conditions={'invalid': lambda x: x}
@@ -28,7 +36,7 @@ def test_missing_context():
         dependencies=('a',),
         conditions={'value': lambda a: a}
     )
-    with pytest.raises(ValidationError, match="Context required"):
+    with pytest.raises(ValidationError, match=_MISSING_CTX_RE):
         param.apply("test")
 
 def test_missing_dependency():
@@ -37,7 +45,7 @@ def test_missing_dependency():
         dependencies=('a', 'b'),
         conditions={'value': lambda a, b: a + b}
     )
-    with pytest.raises(ValidationError, match="Missing required dependency"):
+    with pytest.raises(ValidationError, match=_MISSING_DEP_RE):
         param.apply("test", context={'a': 1})
 
 class TestValueCondition:
@@ -63,73 +71,71 @@ class TestValueCondition:
         assert result == "3"
         assert isinstance(result, str)
 
+@pytest.fixture(scope="class")
+def flag_include_param():
+    """Shared parameter; apply() re-evaluates its conditions on every call"""
+    return ConditionalParameter(
+        dependencies=('flag',),
+        conditions={'include': lambda flag: flag}
+    )
+
 class TestIncludeCondition:
     """Tests for the 'include' condition"""
 
-    def test_include_true(self):
+    def test_include_true(self, flag_include_param):
         """Test parameter inclusion"""
-        param = ConditionalParameter(
-            dependencies=('flag',),
-            conditions={'include': lambda flag: flag}
-        )
-        result = param.apply("test", context={'flag': True})
+        result = flag_include_param.apply("test", context={'flag': True})
         assert result == "test"
 
-    def test_include_false(self):
+    def test_include_false(self, flag_include_param):
         """Test parameter exclusion"""
-        param = ConditionalParameter(
-            dependencies=('flag',),
-            conditions={'include': lambda flag: flag}
-        )
-        result = param.apply("test", context={'flag': False})
+        result = flag_include_param.apply("test", context={'flag': False})
         assert result is None
 
+@pytest.fixture(scope="class")
+def flag_required_param():
+    """Shared parameter; apply() re-evaluates its conditions on every call"""
+    return ConditionalParameter(
+        dependencies=('flag',),
+        conditions={'required': lambda flag: flag},
+        type=PT.STRING
+    )
+
 class TestRequiredCondition:
     """Tests for the 'required' condition"""
 
-    def test_required_true(self):
+    def test_required_true(self, flag_required_param):
         """Test required=True condition"""
-        param = ConditionalParameter(
-            dependencies=('flag',),
-            conditions={'required': lambda flag: flag},
-            type=PT.STRING
-        )
-        with pytest.raises(ValidationError, match="is required"):
-            param.apply(None, context={'flag': True})
+        with pytest.raises(ValidationError, match=_REQUIRED_RE):
+            flag_required_param.apply(None, context={'flag': True})
 
-    def test_required_false(self):
+    def test_required_false(self, flag_required_param):
         """Test required=False condition"""
-        param = ConditionalParameter(
-            dependencies=('flag',),
-            conditions={'required': lambda flag: flag}
-        )
-        result = param.apply(None, context={'flag': False})
+        result = flag_required_param.apply(None, context={'flag': False})
         assert result is None
 
+@pytest.fixture(scope="class")
+def minmax_validate_param():
+    """Shared parameter; apply() re-evaluates its conditions on every call"""
+    return ConditionalParameter(
+        dependencies=('min', 'max'),
+        conditions={
+            'validate': lambda val, min_, max_: min_ <= val <= max_
+        }
+    )
+
 class TestValidateCondition:
     """Tests for the 'validate' condition"""
 
-    def test_validate_success(self):
+    def test_validate_success(self, minmax_validate_param):
         """Test successful validation"""
-        param = ConditionalParameter(
-            dependencies=('min', 'max'),
-            conditions={
-                'validate': lambda val, min_, max_: min_ <= val <= max_
-            }
-        )
-        result = param.apply(5, context={'min': 0, 'max': 10})
+        result = minmax_validate_param.apply(5, context={'min': 0, 'max': 10})
         assert result == 5
 
-    def test_validate_failure(self):
+    def test_validate_failure(self, minmax_validate_param):
         """Test validation failure"""
-        param = ConditionalParameter(
-            dependencies=('min', 'max'),
-            conditions={
-                'validate': lambda val, min_, max_: min_ <= val <= max_
-            }
-        )
-        with pytest.raises(ValidationError, match="Conditional validation failed"):
-            param.apply(15, context={'min': 0, 'max': 10})
+        with pytest.raises(ValidationError, match=_VALIDATION_FAILED_RE):
+            minmax_validate_param.apply(15, context={'min': 0, 'max': 10})
 
 class TestMultipleConditions:
     """Tests for multiple conditions working together"""
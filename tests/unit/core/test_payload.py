@@ -12,6 +12,16 @@ from clientfactory.core.payload import (
 )
 
 
+@pytest.fixture(scope="module")
+def sample_payload():
+    """Shared read-only payload; tests only call validate/apply on it"""
+    return Payload(
+        query=Parameter(required=True),
+        limit=Parameter(type=PT.NUMBER, default=10),
+        sort=Parameter(choices=["asc", "desc"], default="asc")
+    )
+
+
 # Tests for Parameter
 def test_parameter_initialization():
     """Test parameter initialization with different configurations"""
@@ -182,12 +192,9 @@ def test_payload_initialization():
     assert payload.parameters["filters"].children["min"].type == PT.NUMBER
 
 
-def test_payload_validation():
+def test_payload_validation(sample_payload):
     """Test payload validation rules"""
-    payload = Payload(
-        query=Parameter(required=True),
-        limit=Parameter(type=PT.NUMBER, default=10)
-    )
+    payload = sample_payload
 
     # Valid data
     assert payload.validate({"query": "search term"})
@@ -206,13 +213,9 @@ def test_payload_validation():
         payload.validate({"query": "search term", "limit": "twenty"})
 
 
-def test_payload_apply():
+def test_payload_apply(sample_payload):
     """Test payload application with transformation"""
-    payload = Payload(
-        query=Parameter(required=True),
-        limit=Parameter(type=PT.NUMBER, default=10),
-        sort=Parameter(choices=["asc", "desc"], default="asc")
-    )
+    payload = sample_payload
 
     # Basic application
     result = payload.apply({"query": "search term"})
@@ -244,44 +247,49 @@ def test_payload_attribute_access():
 
 
 # Tests for PayloadBuilder
-def test_payload_builder():
-    """Test payload builder functionality"""
-    builder = PayloadBuilder()
-
-    # Add parameters
-    builder.addparam("query", type=PT.STRING, required=True)
-    builder.addparam("limit", type=PT.NUMBER, default=10)
-
-    # Add nested parameter
-    builder.addnestedparam(
-        "filters",
-        children={
-            "min": {"type": PT.NUMBER},
-            "max": {"type": PT.NUMBER}
-        }
+@pytest.fixture(scope="module")
+def built_payload():
+    """Payload built once through the full builder chain"""
+    return (
+        PayloadBuilder()
+        .addparam("query", type=PT.STRING, required=True)
+        .addparam("limit", type=PT.NUMBER, default=10)
+        .addnestedparam(
+            "filters",
+            children={
+                "min": {"type": PT.NUMBER},
+                "max": {"type": PT.NUMBER}
+            }
+        )
+        .addstatic(version="1.0")
+        .build()
     )
 
-    # Add static values
-    builder.addstatic(version="1.0")
 
-    # Build payload
-    payload = builder.build()
+@pytest.mark.parametrize("section,key", [
+    ("parameters", "query"),
+    ("parameters", "limit"),
+    ("parameters", "filters"),
+    ("static", "version"),
+])
+def test_payload_builder_keys(built_payload, section, key):
+    """Test builder output contains the added parameters and static values"""
+    assert key in getattr(built_payload, section)
 
-    # Verify payload
-    assert "query" in payload.parameters
-    assert "limit" in payload.parameters
-    assert "filters" in payload.parameters
-    assert "version" in payload.static
-    assert payload.parameters["query"].required
-    assert payload.parameters["limit"].default == 10
-    assert "min" in payload.parameters["filters"].children
-    assert "max" in payload.parameters["filters"].children
+
+def test_payload_builder(built_payload):
+    """Test payload builder functionality"""
+    assert built_payload.parameters["query"].required
+    assert built_payload.parameters["limit"].default == 10
+    assert "min" in built_payload.parameters["filters"].children
+    assert "max" in built_payload.parameters["filters"].children
 
 
 # Tests for PayloadTemplate
-def test_payload_template():
-    """Test payload template functionality"""
-    template = PayloadTemplate(
+@pytest.fixture(scope="module")
+def base_template():
+    """Shared template; build() and extend() leave it unchanged"""
+    return PayloadTemplate(
         parameters={
             "query": {"type": PT.STRING.value, "required": True},
             "limit": {"type": PT.NUMBER.value, "default": 10}
@@ -289,28 +297,43 @@ def test_payload_template():
         static={"version": "1.0"}
     )
 
-    # Build from template
-    payload = template.build()
 
-    # Verify payload
-    assert "query" in payload.parameters
-    assert "limit" in payload.parameters
-    assert "version" in payload.static
-    assert payload.parameters["query"].required
-    assert payload.parameters["limit"].default == 10
+@pytest.fixture(scope="module")
+def template_payload(base_template):
+    """Payload built once from the base template"""
+    return base_template.build()
+
+
+@pytest.mark.parametrize("section,key", [
+    ("parameters", "query"),
+    ("parameters", "limit"),
+    ("static", "version"),
+])
+def test_template_basic_build(template_payload, section, key):
+    """Test building a payload from a template"""
+    assert key in getattr(template_payload, section)
 
-    # Build with overrides
-    payload = template.build(
+
+def test_template_basic_build_values(template_payload):
+    """Test template parameter definitions are applied"""
+    assert template_payload.parameters["query"].required
+    assert template_payload.parameters["limit"].default == 10
+
+
+def test_template_overrides(base_template):
+    """Test building a payload from a template with overrides"""
+    payload = base_template.build(
         query={"default": "default search"},
         limit=Parameter(default=20)
     )
 
-    # Verify overrides
     assert payload.parameters["query"].default == "default search"
     assert payload.parameters["limit"].default == 20
 
-    # Test template extension
-    extended = template.extend(
+
+def test_template_extend(base_template):
+    """Test template extension"""
+    extended = base_template.extend(
         parameters={
             "sort": {"choices": ["asc", "desc"], "default": "asc"}
         },
@@ -10,6 +10,11 @@ from clientfactory.core.request import (
     RequestError, ValidationError
 )
 
+# shared configs; tests never mutate them (clone() builds a new config)
+_CONFIG_30S = RequestConfig(timeout=30.0)
+_CONFIG_60S = RequestConfig(timeout=60.0)
+_CONFIG_60S_5RETRY = RequestConfig(timeout=60.0, maxretries=5)
+
 
 def test_request_initialization():
     """Test request initialization with different configurations"""
@@ -23,7 +28,7 @@ def test_request_initialization():
     assert isinstance(req.config, RequestConfig)
 
     # Full initialization
-    config = RequestConfig(timeout=60.0, maxretries=5)
+    config = _CONFIG_60S_5RETRY
     req = Request(
         method=RequestMethod.POST,
         url="https://api.example.com/test",
@@ -42,22 +47,21 @@ def test_request_initialization():
     assert req.config.maxretries == 5
 
 
-def test_request_method_conversion():
+@pytest.mark.parametrize("method,expected", [
+    ("get", RequestMethod.GET),
+    ("POST", RequestMethod.POST),
+])
+def test_request_method_conversion(method, expected):
     """Test method string conversion to enum"""
-    # String to enum conversion
     req = Request(
-        method="get",
+        method=method,
         url="https://api.example.com/test"
     )
-    assert req.method == RequestMethod.GET
+    assert req.method == expected
 
-    req = Request(
-        method="POST",
-        url="https://api.example.com/test"
-    )
-    assert req.method == RequestMethod.POST
 
-    # Invalid method
+def test_request_invalid_method():
+    """Test invalid method strings are rejected"""
     with pytest.raises(ValidationError):
         Request(
             method="INVALID",
@@ -125,7 +129,7 @@ def test_request_clone():
         url="https://api.example.com/test",
         params={"param1": "value1"},
         headers={"Accept": "application/json"},
-        config=RequestConfig(timeout=30.0)
+        config=_CONFIG_30S
     )
 
     # Clone with updates
@@ -148,41 +152,35 @@ def test_request_clone():
     clone = req.clone(
         config={"timeout": 60.0, "maxretries": 5}
     )
-    assert clone.config.timeout == 60.0
-    assert clone.config.maxretries == 5
+    assert clone.config == _CONFIG_60S_5RETRY
+    assert req.config is _CONFIG_30S
 
     # Clone with invalid config
     with pytest.raises(ValidationError):
         req.clone(config="invalid")
 
 
-def test_request_factory():
+@pytest.mark.parametrize("verb,path,kwargs,method,url", [
+    ("get", "users", {}, RequestMethod.GET, "https://api.example.com/users"),
+    ("post", "users", {"json": {"name": "test"}}, RequestMethod.POST, "https://api.example.com/users"),
+    ("put", "users/123", {"json": {"name": "updated"}}, RequestMethod.PUT, "https://api.example.com/users/123"),
+    ("patch", "users/123", {"json": {"status": "active"}}, RequestMethod.PATCH, "https://api.example.com/users/123"),
+    ("delete", "users/123", {}, RequestMethod.DELETE, "https://api.example.com/users/123"),
+])
+def test_request_factory(verb, path, kwargs, method, url):
     """Test RequestFactory functionality"""
     from clientfactory.core.request import RequestFactory
 
     # Create factory
     factory = RequestFactory(
         baseurl="https://api.example.com",
-        defaultconfig=RequestConfig(timeout=60.0)
+        defaultconfig=_CONFIG_60S
     )
 
     # Create request with factory
-    req = factory.get("users")
-    assert req.method == RequestMethod.GET
-    assert req.url == "https://api.example.com/users"
+    req = getattr(factory, verb)(path, **kwargs)
+    assert req.method == method
+    assert req.url == url
     assert req.config.timeout == 60.0
-
-    # Test other factory methods
-    req = factory.post("users", json={"name": "test"})
-    assert req.method == RequestMethod.POST
-    assert req.json == {"name": "test"}
-
-    req = factory.put("users/123", json={"name": "updated"})
-    assert req.method == RequestMethod.PUT
-    assert req.url == "https://api.example.com/users/123"
-
-    req = factory.patch("users/123", json={"status": "active"})
-    assert req.method == RequestMethod.PATCH
-
-    req = factory.delete("users/123")
-    assert req.method == RequestMethod.DELETE
+    if "json" in kwargs:
+        assert req.json == kwargs["json"]
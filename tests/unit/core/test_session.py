@@ -3,6 +3,7 @@
 Tests for the core.session module
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call
 
 from clientfactory.core.session import (
@@ -13,22 +14,40 @@ from clientfactory.core.request import Request, RequestMethod
 from clientfactory.core.response import Response
 
 
-@pytest.fixture
-def mock_requests_session():
-    """Create a mock for the requests.Session"""
-    with patch('requests.Session') as mock_class:
-        # Create a session instance with the required attributes
-        session_instance = MagicMock()
-        session_instance.headers = MagicMock()
-        session_instance.cookies = MagicMock()
-        session_instance.proxies = MagicMock()
+def _make_request_mock():
+    """Build a Request mock with the attributes the session reads"""
+    m = MagicMock(spec=Request)
+    m.method = RequestMethod.GET
+    m.url = "https://api.example.com/test"
+    m.params = {}
+    m.headers = {}
+    m.cookies = {}
+    m.json = None
+    m.data = None
+    m.files = None
+    m.config = SimpleNamespace(timeout=30.0, allowredirects=True, stream=False)
+    m.prepare.return_value = m
+    return m
 
-        # Configure return value for the class
-        mock_class.return_value = session_instance
 
-        yield session_instance
+@pytest.fixture(scope="module")
+def _request_template():
+    return _make_request_mock()
 
 
+@pytest.fixture
+def request_mock(_request_template):
+    """Shared request mock with its recorded calls cleared"""
+    _request_template.reset_mock()
+    return _request_template
+
+
+@pytest.fixture(autouse=True, scope="module")
+def patched_requests_session():
+    """Patch requests.Session once for the module; tests reset the shared instance"""
+    with patch('requests.Session') as mock_class:
+        yield mock_class
+
 
 def test_session_initialization():
     """Test session initialization with different configurations"""
@@ -52,7 +71,7 @@ def test_session_initialization():
 
 
 # Fix for test_session_create_session:
-def test_session_create_session():
+def test_session_create_session(patched_requests_session):
     """Test the creation of the underlying requests session"""
     # Create config
     config = SessionConfig(
@@ -63,89 +82,72 @@ def test_session_create_session():
         maxretries=3
     )
 
-    # Use patch directly in the test
-    with patch('requests.Session') as mock_session_class:
-        # Create mock session instance
-        mock_session = MagicMock()
-        mock_session.headers = MagicMock()
-        mock_session.cookies = MagicMock()
-        mock_session.proxies = MagicMock()
-
-        # Set return value
-        mock_session_class.return_value = mock_session
+    # Reset the shared session instance
+    mock_session = patched_requests_session.return_value
+    mock_session.reset_mock()
+    mock_session.headers = MagicMock()
+    mock_session.cookies = MagicMock()
+    mock_session.proxies = MagicMock()
 
-        # Create the session
-        session = Session(config=config)
+    # Create the session
+    session = Session(config=config)
 
-        # Verify the mocks were called
-        mock_session.headers.update.assert_called_with({"User-Agent": "ClientFactory/1.0"})
-        mock_session.cookies.update.assert_called_with({"session": "abc123"})
-        mock_session.proxies.update.assert_called_with({"http": "http://proxy.example.com"})
-        assert mock_session.verify == False
+    # Verify the mocks were called
+    mock_session.headers.update.assert_called_with({"User-Agent": "ClientFactory/1.0"})
+    mock_session.cookies.update.assert_called_with({"session": "abc123"})
+    mock_session.proxies.update.assert_called_with({"http": "http://proxy.example.com"})
+    assert mock_session.verify == False
 
 
-def test_session_hooks():
+def test_session_hooks(default_session_config):
     """Test adding request and response hooks"""
-    session = Session()
+    session = Session(config=default_session_config)
 
     # Add request hook
-    request_hook = MagicMock(return_value=MagicMock(spec=Request))
+    request_hook = MagicMock(return_value=object())
     session.addrequesthook(request_hook)
     assert request_hook in session._requesthooks
 
     # Add response hook
-    response_hook = MagicMock(return_value=MagicMock(spec=Response))
+    response_hook = MagicMock(return_value=object())
     session.addresponsehook(response_hook)
     assert response_hook in session._responsehooks
 
 
-def test_session_prepare_request():
+def test_session_prepare_request(patched_requests_session, request_mock):
     """Test request preparation process"""
     # Create session with auth
     auth = MagicMock()
     auth.prepare.return_value = MagicMock(spec=Request)
 
-    # Mock requests.Session with proper attributes
-    with patch('requests.Session', autospec=True) as mock_session_class:
-        mock_session = MagicMock()
-        mock_session.headers = {}
-        mock_session.cookies = {}
-        mock_session_class.return_value = mock_session
-
-        session = Session(auth=auth)
+    # Reset the shared session instance with plain dict attributes
+    mock_session = patched_requests_session.return_value
+    mock_session.reset_mock()
+    mock_session.headers = {}
+    mock_session.cookies = {}
 
-        # Add request hook
-        request_hook = MagicMock(side_effect=lambda req: req)
-        session.addrequesthook(request_hook)
+    session = Session(auth=auth)
 
-        # Create request
-        request = MagicMock(spec=Request)
-        request.prepare.return_value = request
-        request.method = RequestMethod.GET
-        request.url = "https://api.example.com/test"
-        request.params = {}
-        request.headers = {}
-        request.cookies = {}
-        request.json = None
-        request.data = None
-        request.files = None
+    # Add request hook
+    request_hook = MagicMock(side_effect=lambda req: req)
+    session.addrequesthook(request_hook)
 
-        # Prepare request
-        with patch('requests.Request', autospec=True) as mock_request:
-            result = session.preparerequest(request)
+    # Prepare request
+    with patch('requests.Request') as mock_request:
+        result = session.preparerequest(request_mock)
 
-            # Check request hook was called
-            request_hook.assert_called_once_with(request)
+        # Check request hook was called
+        request_hook.assert_called_once_with(request_mock)
 
-            # Check auth was applied
-            auth.prepare.assert_called_once()
+        # Check auth was applied
+        auth.prepare.assert_called_once()
 
 
-@patch('requests.Session')
-def test_session_send(mock_session_class):
+def test_session_send(patched_requests_session, request_mock):
     """Test sending a request"""
-    # Create mock session instance
-    mock_session = MagicMock()
+    # Reset the shared session instance
+    mock_session = patched_requests_session.return_value
+    mock_session.reset_mock()
     mock_session.headers = MagicMock()
     mock_session.cookies = MagicMock()
 
@@ -158,41 +160,22 @@ def test_session_send(mock_session_class):
     # Set up return values
     mock_session.send.return_value = response
     mock_session.prepare_request.return_value = MagicMock()
-    mock_session_class.return_value = mock_session
 
     # Create session
     session = Session()
 
-    # Create request with properly mocked config
-    request = MagicMock(spec=Request)
-    # Add config attribute
-    request.config = MagicMock()
-    request.config.timeout = 30.0
-    request.config.allowredirects = True
-    request.config.stream = False
-
-    request.prepare.return_value = request
-    request.method = RequestMethod.GET
-    request.url = "https://api.example.com/test"
-    request.params = {}
-    request.headers = {}
-    request.cookies = {}
-    request.json = None
-    request.data = None
-    request.files = None
-
     # Send request
-    result = session.send(request)
+    result = session.send(request_mock)
 
     # Verify request was sent
     assert mock_session.send.called
     assert isinstance(result, Response)
 
 
-def test_session_context_manager():
+def test_session_context_manager(default_session_config):
     """Test using session as a context manager"""
     # Create session
-    session = Session()
+    session = Session(config=default_session_config)
     session.close = MagicMock()
 
     # Use as context manager
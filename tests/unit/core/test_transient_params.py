@@ -1,74 +1,121 @@
 # ~/ClientFactory/tests/unit/core/test_transient_params.py
+import copy
 import pytest
-import json
 from clientfactory.core.payload import (
     Parameter, Payload, ValidationError,
     ParameterType as PT, ConditionalParameter
 )
 
-def test_basic_transient_param():
-    """Test basic transient parameter behavior"""
+@pytest.mark.parametrize("payload_factory,inputs,expected_present,expected_vals", [
+    pytest.param(
+        lambda: Payload(
+            visible=Parameter(default="visible"),
+            hidden=Parameter(default="hidden", transient=True)
+        ),
+        {}, {"visible"}, {"visible": "visible"},
+        id="basic"
+    ),
+    pytest.param(
+        lambda: Payload(
+            helper=Parameter(
+                default=100,
+                transform=lambda x: f"value>={x}",
+                transient=True
+            ),
+            filter=ConditionalParameter(
+                dependencies=('helper',),
+                conditions={'value': lambda h: [h]}
+            )
+        ),
+        {}, {"filter"}, {"filter": ["value>=100"]},
+        id="transform"
+    ),
+    pytest.param(
+        lambda: Payload(
+            normal1=Parameter(default="n1"),
+            trans1=Parameter(default="t1", transient=True),
+            normal2=Parameter(default="n2"),
+            trans2=Parameter(default="t2", transient=True)
+        ),
+        {}, {"normal1", "normal2"}, {"normal1": "n1", "normal2": "n2"},
+        id="mixed"
+    ),
+    pytest.param(
+        lambda: Payload(
+            helper=Parameter(
+                name="different_name",
+                default="value",
+                transient=True
+            )
+        ),
+        {}, set(), {},
+        id="name"
+    ),
+    pytest.param(
+        lambda: Payload(
+            helper=Parameter(
+                type=PT.NUMBER,
+                transient=True
+            )
+        ),
+        {"helper": 123}, set(), {},
+        id="validated"
+    ),
+])
+def test_transient_params(payload_factory, inputs, expected_present, expected_vals):
+    """Test that transient parameters are resolved but left out of the result"""
+    p = payload_factory()
+    r = p.apply(inputs)
+    assert set(r.keys()) == expected_present
+    assert {k: r[k] for k in expected_vals} == expected_vals
+
+def test_transient_validation():
+    """Test that transient parameters still undergo validation"""
     payload = Payload(
-        visible=Parameter(default="visible"),
-        hidden=Parameter(default="hidden", transient=True)
+        helper=Parameter(
+            type=PT.NUMBER,
+            transient=True
+        )
     )
 
-    result = payload.apply({})
-    assert "visible" in result
-    assert "hidden" not in result
-    assert result["visible"] == "visible"
+    with pytest.raises(ValidationError):
+        payload.apply({"helper": "not a number"})
 
-def test_transient_with_transform():
-    """Test transient parameter with transformation"""
+@pytest.fixture(scope="class")
+def price_payload():
+    """Shared payload; apply() must not mutate its parameters"""
     payload = Payload(
-        helper=Parameter(
-            default=100,
-            transform=lambda x: f"value>={x}",
+        minprice=Parameter(
+            default=0,
+            transform=lambda x: f"price>={x}",
             transient=True
         ),
-        filter=ConditionalParameter(
-            dependencies=('helper',),
-            conditions={'value': lambda h: [h]}
+        maxprice=Parameter(
+            default=1000,
+            transform=lambda x: f"price<={x}",
+            transient=True
+        ),
+        filters=ConditionalParameter(
+            dependencies=('minprice', 'maxprice'),
+            conditions={
+                'value': lambda min_, max_: [min_, max_]
+            }
         )
     )
-
-    result = payload.apply({})
-    assert "helper" not in result
-    assert result["filter"] == ["value>=100"]
+    parameters = copy.deepcopy(payload.parameters)
+    yield payload
+    assert payload.parameters == parameters
 
 class TestPriceFilterExample:
     """Tests using price filter example case"""
 
-    @pytest.fixture
-    def price_payload(self):
-        return Payload(
-            minprice=Parameter(
-                default=0,
-                transform=lambda x: f"price>={x}",
-                transient=True
-            ),
-            maxprice=Parameter(
-                default=1000,
-                transform=lambda x: f"price<={x}",
-                transient=True
-            ),
-            filters=ConditionalParameter(
-                dependencies=('minprice', 'maxprice'),
-                conditions={
-                    'value': lambda min_, max_: json.dumps([min_, max_])
-                }
-            )
-        )
-
     def test_default_values(self, price_payload):
         """Test payload with default values"""
         result = price_payload.apply({})
         assert "minprice" not in result
         assert "maxprice" not in result
         assert "filters" in result
-
-        filters = json.loads(result["filters"])
-        assert filters == ["price>=0", "price<=1000"]
+        assert result["filters"] == ["price>=0", "price<=1000"]
 
     def test_custom_values(self, price_payload):
         """Test payload with custom price values"""
@@ -79,9 +126,7 @@ class TestPriceFilterExample:
         assert "minprice" not in result
         assert "maxprice" not in result
         assert "filters" in result
-
-        filters = json.loads(result["filters"])
-        assert filters == ["price>=100", "price<=500"]
+        assert result["filters"] == ["price>=100", "price<=500"]
 
 def test_transient_required_param():
     """Test transient parameter that is required"""
@@ -105,51 +150,6 @@ def test_transient_required_param():
     assert "helper" not in result
     assert result["dependent"] == "TEST"
 
-def test_mixed_params():
-    """Test mix of transient and normal parameters"""
-    payload = Payload(
-        normal1=Parameter(default="n1"),
-        trans1=Parameter(default="t1", transient=True),
-        normal2=Parameter(default="n2"),
-        trans2=Parameter(default="t2", transient=True)
-    )
-
-    result = payload.apply({})
-    assert set(result.keys()) == {"normal1", "normal2"}
-    assert result["normal1"] == "n1"
-    assert result["normal2"] == "n2"
-
-def test_transient_with_name():
-    """Test transient parameter with custom name"""
-    payload = Payload(
-        helper=Parameter(
-            name="different_name",
-            default="value",
-            transient=True
-        )
-    )
-
-    result = payload.apply({})
-    assert "helper" not in result
-    assert "different_name" not in result
-
-def test_transient_validation():
-    """Test that transient parameters still undergo validation"""
-    payload = Payload(
-        helper=Parameter(
-            type=PT.NUMBER,
-            transient=True
-        )
-    )
-
-    # Should still validate type
-    with pytest.raises(ValidationError):
-        payload.apply({"helper": "not a number"})
-
-    # Should work with valid type
-    result = payload.apply({"helper": 123})
-    assert "helper" not in result
-
 def test_conditional_on_multiple_transients():
     """Test conditional parameter depending on multiple transient parameters"""
     payload = Payload(
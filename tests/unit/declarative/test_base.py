@@ -7,39 +7,51 @@ from clientfactory.declarative.base import (
 )
 from clientfactory.declarative.decorators import declarativemethod
 
+# read-only fixtures: the metaclass runs once at import; tests that
+# mutate metadata define their own classes
+class BasicComponent(DeclarativeComponent):
+    attribute = "value"
+
+class Parent(DeclarativeComponent):
+    parent_attr = "parent"
+
+class Child(Parent):
+    child_attr = "child"
+
+class MethodContainer(DeclarativeContainer):
+    @declarativemethod
+    def method(self):
+        pass
+
+    class NestedComponent(DeclarativeComponent):
+        pass
+
+class Regular:
+    pass
+
+class Declarative(DeclarativeComponent):
+    pass
+
+class DiscoveryContainer(DeclarativeContainer):
+    class Component(DeclarativeComponent):
+        name = "mycomponent"
+
 def test_declarative_meta_basic():
     """Test basic DeclarativeMeta functionality"""
-    class TestComponent(DeclarativeComponent):
-        attribute = "value"
-
-    assert hasattr(TestComponent, '__metadata__')
-    assert TestComponent.__metadata__['attribute'] == "value"
+    assert hasattr(BasicComponent, '__metadata__')
+    assert BasicComponent.__metadata__['attribute'] == "value"
 
 def test_declarative_component_inheritance():
     """Test metadata inheritance between components"""
-    class Parent(DeclarativeComponent):
-        parent_attr = "parent"
-
-    class Child(Parent):
-        child_attr = "child"
-
     assert Child.getmetadata('parent_attr') == "parent"
     assert Child.getmetadata('child_attr') == "child"
 
 def test_declarative_container():
     """Test container functionality"""
-    class Container(DeclarativeContainer):
-        @declarativemethod
-        def method(self):
-            pass
-
-        class NestedComponent(DeclarativeComponent):
-            pass
-
-    assert 'methods' in Container.__metadata__
-    assert 'components' in Container.__metadata__
-    assert 'method' in Container.__metadata__['methods']
-    assert 'nestedcomponent' in Container.__metadata__['components']
+    assert 'methods' in MethodContainer.__metadata__
+    assert 'components' in MethodContainer.__metadata__
+    assert 'method' in MethodContainer.__metadata__['methods']
+    assert 'nestedcomponent' in MethodContainer.__metadata__['components']
 
 def test_metadata_operations():
     """Test metadata manipulation methods"""
@@ -59,12 +71,6 @@ def test_metadata_operations():
 
 def test_isdeclarative():
     """Test isdeclarative utility function"""
-    class Regular:
-        pass
-
-    class Declarative(DeclarativeComponent):
-        pass
-
     assert not isdeclarative(Regular)
     assert isdeclarative(Declarative)
 
@@ -86,8 +92,4 @@ def test_metadata_copying():
 
 def test_declarative_container_discovery():
     """Test container component discovery"""
-    class Container(DeclarativeContainer):
-        class Component(DeclarativeComponent):
-            name = "mycomponent"
-
-    assert "mycomponent" in Container.__metadata__['components']
+    assert "mycomponent" in DiscoveryContainer.__metadata__['components']
@@ -3,99 +3,45 @@
 Unit tests for transform decorators
 """
 import pytest
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 from clientfactory.decorators.transform import preprocess, postprocess, transformrequest, transformresponse
 from clientfactory.decorators.method import get, post
-from clientfactory.core.request import Request, RequestMethod
-from clientfactory.core.response import Response
+
+_RESP_JSON = MappingProxyType({"data": "test_value"})
 
 # Create mock Request and Response for testing
 @pytest.fixture
 def mock_request():
-    request = MagicMock(spec=Request)
-    request.clone.return_value = MagicMock(spec=Request)
+    request = MagicMock()
+    request.clone.return_value = MagicMock()
     return request
 
 @pytest.fixture
 def mock_response():
-    response = MagicMock(spec=Response)
-    response.json.return_value = {"data": "test_value", "items": ["item1", "item2"]}
+    response = MagicMock()
+    response.json.return_value = _RESP_JSON
     return response
 
-def test_preprocess_decorator(mock_request):
-    """Test preprocess decorator with method decorator"""
-    def add_header(request):
-        return request.clone(headers={"X-Test": "value"})
-
-    # Test the transform function separately
-    result = add_header(mock_request)
-    mock_request.clone.assert_called_once_with(headers={"X-Test": "value"})
-
-    # Test the decorator
-    @get("test")
-    def test_method():
-        pass
-
-    decorated = preprocess(add_header)(test_method)
-    assert hasattr(decorated, '_methodconfig')
-    assert decorated._methodconfig.preprocess == add_header
-
-def test_postprocess_decorator(mock_response):
-    """Test postprocess decorator with method decorator"""
-    def extract_data(response):
-        return response.json()["data"]
-
-    # Test the transform function separately
-    result = extract_data(mock_response)
-    assert result == "test_value"
-
-    # Test the decorator
-    @get("test")
-    def test_method():
-        pass
-
-    decorated = postprocess(extract_data)(test_method)
-    assert hasattr(decorated, '_methodconfig')
-    assert decorated._methodconfig.postprocess == extract_data
-
-def test_transform_request(mock_request):
-    """Test transformrequest decorator"""
-    transform_func = lambda req: req.clone(headers={"X-API-KEY": "abc123"})
-
-    @get("test")
-    def test_method():
-        pass
-
-    # Then apply the transform decorator
-    decorated = transformrequest(transform_func)(test_method)
-
-    # Check that the transform function was stored as preprocess
-    assert hasattr(decorated, '_methodconfig')
-    assert decorated._methodconfig.preprocess == transform_func
-
-    # Test the transform function
-    result = transform_func(mock_request)
-    mock_request.clone.assert_called_once_with(headers={"X-API-KEY": "abc123"})
-
-def test_transform_response(mock_response):
-    """Test transformresponse decorator"""
-    transform_func = lambda resp: resp.json()["items"]
+@pytest.mark.parametrize("decorator,attr", [
+    (preprocess, "preprocess"),
+    (postprocess, "postprocess"),
+    (transformrequest, "preprocess"),
+    (transformresponse, "postprocess"),
+])
+def test_transform_decorators(decorator, attr):
+    """Test transform decorators store their function on the method config"""
+    transform = lambda obj: obj
 
     @get("test")
-    def test_method():
+    def m():
         pass
 
-    # Then apply the transform decorator
-    decorated = transformresponse(transform_func)(test_method)
-
-    # Check that the transform function was stored as postprocess
+    decorated = decorator(transform)(m)
     assert hasattr(decorated, '_methodconfig')
-    assert decorated._methodconfig.postprocess == transform_func
-
-    # Test the transform function
-    result = transform_func(mock_response)
-    assert result == ["item1", "item2"]
+    assert getattr(decorated._methodconfig, attr) is transform
+    assert decorated.__name__ == m.__name__
 
 def test_preprocess_as_function(mock_request):
     """Test using preprocess as a function decorator"""
@@ -1,5 +1,6 @@
 # ~/ClientFactory/tests/unit/resources/test_managed.py
 from __future__ import annotations
+import functools
 import pytest
 
 from clientfactory.core.request import RequestMethod as RM
@@ -12,45 +13,63 @@ from clientfactory.resources.managed import (
 )
 from clientfactory.decorators import managedresource
 
-def test_managed_resource_metadata():
-    """Test that managed resource attributes are properly processed into metadata"""
+# shared by the declarations below; operations are read-only once declared
+_OPS = {
+    'create': createop(payload=Payload()),
+    'list': listop()
+}
+
+@pytest.fixture(scope="module")
+def session():
+    """Shared session; the setup tests only hand it to resources"""
+    return Session()
+
+@functools.cache
+def _managed_cls():
+    """Declare a resource with all five operation types once"""
     class CustomManaged(ManagedResource):
         operations = {
-            'create': createop(payload=Payload()),
-            'list': listop(),
+            **_OPS,
             'get': readop(),
             'update': updateop(),
             'delete': deleteop()
         }
+    return CustomManaged
 
-    ops = CustomManaged.getmetadata('operations')
+@pytest.fixture(scope="module")
+def ops():
+    """Operations metadata of the shared managed resource"""
+    return _managed_cls().getmetadata('operations')
+
+def test_managed_resource_metadata(ops):
+    """Test that managed resource attributes are properly processed into metadata"""
     assert len(ops) == 5
     assert all(isinstance(op, Operation) for op in ops.values())
-    assert ops['create'].type == OperationType.CREATE
-    assert ops['list'].type == OperationType.LIST
+
+@pytest.mark.parametrize("name,optype", [
+    ("create", OperationType.CREATE),
+    ("list", OperationType.LIST),
+    ("get", OperationType.READ),
+    ("update", OperationType.UPDATE),
+    ("delete", OperationType.DELETE),
+])
+def test_op_type(ops, name, optype):
+    """Test each declared operation keeps its type"""
+    assert ops[name].type == optype
 
 def test_managed_resource_decorator():
     """Test the @managedresource decorator"""
     @managedresource(path="users")
     class Users:
-        operations = {
-            'create': createop(),
-            'list': listop()
-        }
+        operations = _OPS
 
     assert issubclass(Users, ManagedResource)
     assert Users.getmetadata('path') == "users"
     assert len(Users.getmetadata('operations')) == 2
 
-def test_operation_setup():
+def test_operation_setup(session):
     """Test that operations are properly configured as methods"""
-    class CustomManaged(ManagedResource):
-        operations = {
-            'create': createop(payload=Payload()),
-            'list': listop()
-        }
-
-    session = Session()
+    CustomManaged = _managed_cls()
     config = ManagedResourceConfig(
         name="users",
         path="users"
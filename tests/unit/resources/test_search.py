@@ -1,5 +1,6 @@
 # ~/ClientFactory/tests/unit/resources/test_search.py
 from __future__ import annotations
+import functools
 import pytest
 
 from clientfactory.core.request import RequestMethod as RM
@@ -8,15 +9,28 @@ from clientfactory.core.session import Session
 from clientfactory.resources.search import SearchResource, SearchResourceConfig
 from clientfactory.decorators import searchresource
 
-def test_search_resource_metadata():
-    """Test that search resource attributes are properly processed into metadata"""
+# shared by the declarations below; resources only read their payload
+_PAYLOAD = Payload(
+    query=Parameter(required=True),
+    limit=Parameter(default=20)
+)
+
+@functools.cache
+def _search_cls():
+    """Declare the POST search resource once"""
     class CustomSearch(SearchResource):
         requestmethod = RM.POST
-        payload = Payload(
-            query=Parameter(required=True),
-            limit=Parameter(default=20)
-        )
+        payload = _PAYLOAD
+    return CustomSearch
 
+@pytest.fixture(scope="module")
+def session():
+    """Shared session; the setup tests only hand it to resources"""
+    return Session()
+
+def test_search_resource_metadata():
+    """Test that search resource attributes are properly processed into metadata"""
+    CustomSearch = _search_cls()
     assert CustomSearch.getmetadata('requestmethod') == RM.POST
     assert isinstance(CustomSearch.getmetadata('payload'), Payload)
 
@@ -25,23 +39,15 @@ def test_search_resource_decorator():
     @searchresource(path="search")
     class Search:
         requestmethod = RM.POST
-        payload = Payload(
-            query=Parameter(required=True)
-        )
+        payload = _PAYLOAD
 
     assert issubclass(Search, SearchResource)
     assert Search.getmetadata('path') == "search"
     assert Search.getmetadata('requestmethod') == RM.POST
 
-def test_search_method_setup():
+def test_search_method_setup(session):
     """Test that the search method is properly configured"""
-    class CustomSearch(SearchResource):
-        requestmethod = RM.POST
-        payload = Payload(
-            query=Parameter(required=True)
-        )
-
-    session = Session()
+    CustomSearch = _search_cls()
     config = SearchResourceConfig(
         name="search",
         path="search"
@@ -0,0 +1,15 @@
+# ~/ClientFactory/tests/unit/session/conftest.py
+"""
+Pytest configuration for session tests.
+"""
+import pytest
+
+from clientfactory.session.state import StateManager, MemoryStateStore
+
+
+@pytest.fixture(scope="module")
+def make_manager():
+    """Return a factory for state managers backed by a fresh memory store"""
+    def _f(initial=None, **kw):
+        return StateManager(store=MemoryStateStore(initial or {}), **kw)
+    return _f
@@ -5,7 +5,6 @@ from clientfactory.decorators.session import (
     statestore, jsonstore, picklestore, memorystore,
     statemanager, headers, enhancedsession
 )
-from clientfactory.decorators.session import headers
 
 def test_statestore_decorator():
     """Test basic state store decorator"""
@@ -15,25 +14,19 @@ def test_statestore_decorator():
 
     assert TestStore.path == "test.dat"
 
-def test_jsonstore_decorator(tmp_path):
-    """Test JSON store decorator"""
-    @jsonstore(path="test.json")
+@pytest.mark.parametrize("decorator,path,fmt", [
+    (jsonstore, "test.json", "json"),
+    (picklestore, "test.pkl", "pickle"),
+])
+def test_formatstore_decorator(decorator, path, fmt):
+    """Test format-specific store decorators"""
+    @decorator(path=path)
     class TestStore:
         pass
 
     store = TestStore()
-    assert store.path == "test.json"
-    assert store.format == "json"
-
-def test_picklestore_decorator(tmp_path):
-    """Test pickle store decorator"""
-    @picklestore(path="test.pkl")
-    class TestStore:
-        pass
-
-    store = TestStore()
-    assert store.path == "test.pkl"
-    assert store.format == "pickle"
+    assert store.path == path
+    assert store.format == fmt
 
 def test_memorystore_decorator():
     """Test memory store decorator"""
@@ -66,8 +59,8 @@ def test_headers_decorator():
     class TestHeaders:
         pass
 
-    headers = TestHeaders()
-    assert headers.get()["User-Agent"] == "Test/1.0"
+    h = TestHeaders()
+    assert h.get()["User-Agent"] == "Test/1.0"
 
 def test_enhancedsession_decorator():
     """Test enhanced session decorator"""
@@ -1,29 +1,32 @@
 # ~/ClientFactory/tests/unit/session/test_enhanced.py
 """Tests for enhanced session"""
 import pytest
-from clientfactory.session import (
-    EnhancedSession, Headers,
-    StateManager, MemoryStateStore
-)
+from clientfactory.session import EnhancedSession, Headers
 from clientfactory.core import SessionConfig
 
-def test_enhanced_session_basic():
-    """Test basic enhanced session"""
-    session = EnhancedSession()
-    assert session is not None
-
-def test_enhanced_session_with_state():
+@pytest.fixture(scope="module")
+def make_session():
+    """Build EnhancedSessions, closing every one built once the module is done"""
+    created = []
+    def _f(**kw):
+        s = EnhancedSession(**kw)
+        created.append(s)
+        return s
+    yield _f
+    for s in created:
+        s.close()
+
+def test_enhanced_session_with_state(make_session, make_manager):
     """Test enhanced session with state management"""
-    manager = StateManager(store=MemoryStateStore())
-    session = EnhancedSession(statemanager=manager)
+    manager = make_manager()
+    session = make_session(statemanager=manager)
 
     assert session.statemanager is manager
 
-def test_enhanced_session_cookie_persistence():
+def test_enhanced_session_cookie_persistence(make_session, make_manager):
     """Test cookie persistence"""
-    store = MemoryStateStore()
-    manager = StateManager(store=store)
-    session = EnhancedSession(
+    manager = make_manager()
+    session = make_session(
         statemanager=manager,
         persistcookies=True
     )
@@ -32,20 +35,26 @@ def test_enhanced_session_cookie_persistence():
     session._session.cookies.update({"sessionid": "test123"})
     session.close()
 
-    # New session should load cookies
-    new_session = EnhancedSession(
+    # Closing should have written the cookies through to the store
+    assert manager.store.load().get("cookies", {}).get("sessionid") == "test123"
+
+def test_enhanced_session_loads_cookies(make_session, make_manager):
+    """Test cookies in state are applied to a new session"""
+    manager = make_manager({"cookies": {"sessionid": "test123"}})
+    session = make_session(
         statemanager=manager,
         persistcookies=True
     )
-    assert new_session._session.cookies["sessionid"] == "test123"
+    assert session._session.cookies["sessionid"] == "test123"
 
-def test_enhanced_session_config():
+def test_enhanced_session_config(make_session):
     """Test session configuration"""
     config = SessionConfig(
         headers={"User-Agent": "Test/1.0"},
         verify=False
     )
-    session = EnhancedSession(config=config)
+    session = make_session(config=config)
 
+    assert session is not None
     assert session._session.headers["User-Agent"] == "Test/1.0"
     assert not session._session.verify
@@ -4,22 +4,25 @@ import pytest
 from clientfactory.decorators.session import headers
 from clientfactory.session.headers import Headers
 
-def test_headers_decorator_basic():
-    """Test basic headers decorator usage"""
+def _decorated_bare():
     @headers
     class TestHeaders:
         static = {"User-Agent": "Test/1.0"}
+    return TestHeaders
 
-    h = TestHeaders()
-    assert h.get()["User-Agent"] == "Test/1.0"
-
-def test_headers_decorator_with_args():
-    """Test headers decorator with arguments"""
+def _decorated_with_args():
     @headers(static={"User-Agent": "Test/1.0"})
     class TestHeaders:
         pass
-
-    h = TestHeaders()
+    return TestHeaders
+
+@pytest.mark.parametrize("make_cls", [
+    pytest.param(_decorated_bare, id="basic"),
+    pytest.param(_decorated_with_args, id="with_args"),
+])
+def test_headers_decorator(make_cls):
+    """Test headers decorator usage"""
+    h = make_cls()()
     assert h.get()["User-Agent"] == "Test/1.0"
 
 def test_headers_decorator_dynamic():
@@ -47,25 +50,13 @@ def test_headers_decorator_dynamic():
 
 def test_headers_decorator_update():
     """Test updating headers after creation"""
-    import traceback
-    from clientfactory.decorators.session import headers
-    #print("\nDebugging headers decorator:")
-    #print(f"headers import: {headers}")
-
-    try:
-        @headers(static={"User-Agent": "Test/1.0"})
-        class TestHeaders:
-            pass
-    except Exception as e:
-        #print(f"Exception during decoration: {e}")
-        #print("Traceback:")
-        traceback.print_exc()
-        raise
+    @headers(static={"User-Agent": "Test/1.0"})
+    class TestHeaders:
+        pass
 
     h = TestHeaders()
     h.update({"Accept": "application/json"})
 
     result = h.get()
-    #print(f"Final headers: {result}")
     assert result["User-Agent"] == "Test/1.0"
     assert result["Accept"] == "application/json"
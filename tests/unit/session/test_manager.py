@@ -1,35 +1,31 @@
 # ~/ClientFactory/tests/unit/session/test_manager.py
 """Tests for state management"""
 import pytest
-from clientfactory.session.state import StateManager, MemoryStateStore
 
-def test_state_manager_basic():
+def test_state_manager_basic(make_manager):
     """Test basic state manager operations"""
-    store = MemoryStateStore()
-    manager = StateManager(store=store)
+    manager = make_manager()
 
     manager.set("key", "value")
     assert manager.get("key") == "value"
 
-def test_state_manager_autoload():
+def test_state_manager_autoload(make_manager):
     """Test state manager autoload"""
-    store = MemoryStateStore({"initial": "value"})
-    manager = StateManager(store=store, autoload=True)
+    manager = make_manager({"initial": "value"}, autoload=True)
 
     assert manager.get("initial") == "value"
 
-def test_state_manager_autosave():
+def test_state_manager_autosave(make_manager):
     """Test state manager autosave"""
-    store = MemoryStateStore()
-    manager = StateManager(store=store, autosave=True)
+    manager = make_manager(autosave=True)
 
     manager.set("key", "value")
-    loaded = store.load()
+    loaded = manager.store.load()
     assert loaded["key"] == "value"
 
-def test_state_manager_batch_update():
+def test_state_manager_batch_update(make_manager):
     """Test state manager batch updates"""
-    manager = StateManager(store=MemoryStateStore())
+    manager = make_manager()
 
     manager.update({
         "key1": "value1",
@@ -39,11 +35,10 @@ def test_state_manager_batch_update():
     assert manager.get("key1") == "value1"
     assert manager.get("key2") == "value2"
 
-def test_state_manager_clear():
+def test_state_manager_clear(make_manager):
     """Test state manager clear"""
-    store = MemoryStateStore({"key": "value"})
-    manager = StateManager(store=store, autoload=True)
+    manager = make_manager({"key": "value"}, autoload=True)
 
     manager.clear()
     assert manager.get("key") is None
-    assert store.load() == {}
+    assert manager.store.load() == {}
@@ -7,6 +7,11 @@ from clientfactory.session.state import (
     JSONStateStore, PickleStateStore, MemoryStateStore
 )
 
+@pytest.fixture(scope="module")
+def state_dir(tmp_path_factory):
+    """One directory for the module's file stores; tests use distinct filenames"""
+    return tmp_path_factory.mktemp("state")
+
 def test_memory_store_basic():
     """Test basic memory store operations"""
     store = MemoryStateStore()
@@ -27,9 +32,9 @@ def test_memory_store_initial_state():
     assert loaded == initial
     assert loaded is not initial
 
-def test_json_store(tmp_path):
+def test_json_store(state_dir):
     """Test JSON store operations"""
-    filepath = tmp_path / "test.json"
+    filepath = state_dir / "test.json"
     store = JSONStateStore(str(filepath))
     test_state = {"key": "value"}
 
@@ -39,9 +44,9 @@ def test_json_store(tmp_path):
     loaded = store.load()
     assert loaded == test_state
 
-def test_pickle_store(tmp_path):
+def test_pickle_store(state_dir):
     """Test pickle store operations"""
-    filepath = tmp_path / "test.pkl"
+    filepath = state_dir / "test.pkl"
     store = PickleStateStore(str(filepath))
     test_state = {"key": "value"}
 